@@ -1,36 +1,41 @@
+import functools
+import hashlib
 import math
-import json
 import random
+import numpy as np
+import orjson
 from typing import Dict, List, Literal, Tuple, Optional, Any
 
-class Akinator:
-    def __init__(self, dataset_path: str, questions_path: str, dataset_type: Literal["json", "sql"] = "json"):
-        self.CERTAINTY_THRESHOLD = 0.90
-        self.MIN_QUESTIONS = 5
-        self.MAX_QUESTIONS = 20
-        self.TOP_N_CANDIDATES = 5
-        self.STRONG_MISMATCH_MULTIPLIER = 0.2
-        self.STRONG_MATCH_MULTIPLIER = 1.35
-        self.SOFT_MATCH_MULTIPLIER = 1.1
-        self.SOFT_MISMATCH_MULTIPLIER = 0.5
-        
-        self.dataset = self._load_data(dataset_path, dataset_type)
-        if not self.dataset:
+class Dataset:
+    """Read-only people/attribute data, loaded once and shared by every game session."""
+
+    def __init__(self, data: List[Dict[str, Any]], questions: Dict[str, str]):
+        if not data:
             raise ValueError("Dataset is empty or not loaded correctly.")
         
-        self.people = [person["name"] for person in self.dataset]
-        self.attrs = self._get_attrs()
-        self.people_attrs_map = {person["name"]: person["attributes"] for person in self.dataset}
-        self.questions = self._get_questions(questions_path)
-        
-        print(f"Building an Akinator game with {len(self.people)} people having {len(self.attrs)} traits...\n")
-        self._reset()
+        self.people = [person["name"] for person in data]
+        self.attrs = self._get_attrs(data)
+        self.person_index = {person: i for i, person in enumerate(self.people)}
+        self.attr_index = {attr: j for j, attr in enumerate(self.attrs)}
+        self.attr_matrix = self._build_attr_matrix(data)
+        self.questions = questions
+        # Question wording never changes, so render it once per attribute instead of on every turn
+        self.question_texts = {attr: self._render_question(attr, questions) for attr in self.attrs}
+        # Identifies the people rows and attribute columns; saved games are positional, so they only load against the same layout
+        self.fingerprint = hashlib.blake2b(orjson.dumps([self.people, self.attrs]), digest_size=8).digest()
+        
+        print(f"Building an Akinator dataset with {len(self.people)} people having {len(self.attrs)} traits...\n")
 
-    def _load_data(self, dataset_path: str, dataset_type: Literal["json", "sql"]):
+    @classmethod
+    def load(cls, dataset_path: str, questions_path: str, dataset_type: Literal["json", "sql"] = "json") -> "Dataset":
+        return cls(cls._load_data(dataset_path, dataset_type), cls._get_questions(questions_path))
+
+    @staticmethod
+    def _load_data(dataset_path: str, dataset_type: Literal["json", "sql"]):
         if dataset_type.lower() == "json":
             try:
-                with open(dataset_path, 'r') as f:
-                    data = json.load(f)
+                with open(dataset_path, 'rb') as f:
+                    data = orjson.loads(f.read())
                 return data
             except Exception as e:
                 print(f"Error loading dataset: {e}")
@@ -43,153 +48,213 @@ class Akinator:
         else:
             raise ValueError("Unsupported dataset type. Use 'json' or 'sql'.")
 
-    def _get_questions(self, questions_path: str) -> Dict[str, str]:
+    @staticmethod
+    def _get_questions(questions_path: str) -> Dict[str, str]:
         try:
-            with open(questions_path, 'r') as f:
-                questions = json.load(f)
+            with open(questions_path, 'rb') as f:
+                questions = orjson.loads(f.read())
             return questions
         
         except Exception as e:
             print(f"Error loading questions: {e}")
             return {}
 
-    def _get_attrs(self) -> List[str]:
+    @staticmethod
+    def _get_attrs(data: List[Dict[str, Any]]) -> List[str]:
         attrs = set()
         
-        for person in self.dataset:
+        for person in data:
             attrs.update(person["attributes"].keys())
         
-        return list(attrs)
+        return sorted(attrs) # Stable column order, so saved asked-attribute bitmasks survive a restart
+
+    @staticmethod
+    def _render_question(attr: str, questions: Dict[str, str]) -> str:
+        q_text = questions.get(attr, f"Is the person {attr.replace('_', ' ')}?")
+        
+        # Special logic for handling nickname
+        if attr.startswith("nickname_"):
+            nickname = attr.replace("nickname_", "").replace("_", " ")
+            if nickname != "None":
+                q_text = "Is the person's nickname " + nickname + "?"
+        
+        return q_text
+
+    def _build_attr_matrix(self, data: List[Dict[str, Any]]) -> np.ndarray:
+        # Dense (people x attrs) 0/1 matrix; attributes missing from a person stay 0.
+        # Column-major so that reading one attribute across all people is contiguous.
+        matrix = np.zeros((len(self.people), len(self.attrs)), dtype=np.uint8, order="F")
+        
+        for i, person in enumerate(data):
+            for attr, value in person["attributes"].items():
+                matrix[i, self.attr_index[attr]] = value
+        
+        return matrix
+
+
+class Akinator:
+    CERTAINTY_THRESHOLD = 0.90
+    MIN_QUESTIONS = 5
+    MAX_QUESTIONS = 20
+    TOP_N_CANDIDATES = 5
+    STRONG_MISMATCH_MULTIPLIER = 0.2
+    STRONG_MATCH_MULTIPLIER = 1.35
+    SOFT_MATCH_MULTIPLIER = 1.1
+    SOFT_MISMATCH_MULTIPLIER = 0.5
+    WRONG_GUESS_MULTIPLIER = 0.01
+
+    # (match, mismatch) multipliers in log space, so updates are plain additions to the log-posterior
+    LOG_STRONG_MULTIPLIERS = (math.log(STRONG_MATCH_MULTIPLIER), math.log(STRONG_MISMATCH_MULTIPLIER))
+    LOG_SOFT_MULTIPLIERS = (math.log(SOFT_MATCH_MULTIPLIER), math.log(SOFT_MISMATCH_MULTIPLIER))
+    LOG_WRONG_GUESS_MULTIPLIER = math.log(WRONG_GUESS_MULTIPLIER)
+
+    # One instance lives per active game session, so keep them free of a per-instance __dict__
+    __slots__ = ("dataset", "log_probs", "_probabilities", "alive_mask", "asked_mask", "n_questions_asked", "n_moves", "RANDOMNESS", "RETRY")
+
+    def __init__(self, dataset: Dataset):
+        # Shared with every other session; only the game state below is per-instance
+        self.dataset = dataset
+        self._reset()
+
+    def _attr_values(self, attr: str) -> np.ndarray:
+        return self.dataset.attr_matrix[:, self.dataset.attr_index[attr]]
 
     def _reset(self):
-        self.probabilities = {person: 1 / len(self.people) for person in self.people}
-        self.asked_attrs = set()
+        self.log_probs = np.zeros(len(self.dataset.people))    # Unnormalized log-posterior, uniform prior
+        self._probabilities = None
+        self.alive_mask = np.ones(len(self.dataset.people), dtype=bool)
+        self.asked_mask = np.zeros(len(self.dataset.attrs), dtype=bool)
         self.n_questions_asked = 0
+        self.n_moves = 0 # Answers and guesses that changed the game; only grows, so it orders saved copies of one game
         self.RANDOMNESS = 0.5
         self.RETRY = False
 
-    def _calc_entropy(self, probs: List[float]) -> float:
-        if not probs or sum(probs) < 1e-9:
-            return 0.0
-        
-        sum_probs = sum(probs)
-        if abs(sum_probs - 1.0) > 1e-9 and len(probs) > 1:  # Normalize if sum > 1
-            probs = [p / sum_probs for p in probs]
+    @staticmethod
+    def _softmax(log_probs: np.ndarray) -> np.ndarray:
+        # Shift so the largest exponent is exp(0): nothing overflows, and eliminated (-inf) entries come out as exactly 0
+        weights = np.exp(log_probs - log_probs.max())
+        return weights / weights.sum()
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        # Posterior is only materialized when read
+        if self._probabilities is None:
+            self._probabilities = self._softmax(self.log_probs)
         
-        return -sum(p * math.log2(p) for p in probs if p > 1e-9)
+        return self._probabilities
 
-    def _get_top_candidates(self, n: int = 0) -> List[Tuple[str, float]]:
-        if not self.probabilities:
-            return []
+    def _rebase_log_probs(self) -> bool:
+        if not np.isfinite(self.log_probs).any():
+            return False
+        
+        # Probabilities are invariant to a common shift, so keep the best candidate at log(1) to avoid drift
+        self.log_probs -= self.log_probs.max()
+        probs = self._softmax(self.log_probs)
+        
+        # Candidates whose posterior drops to 1e-9 or below are eliminated
+        eliminated = probs <= 1e-9
+        self.log_probs[eliminated] = -np.inf
+        self.alive_mask = ~eliminated
+        
+        # Carry the posterior forward instead of recomputing it from log_probs on the next read
+        probs[eliminated] = 0.0
+        self._probabilities = probs / probs.sum()
         
+        return True
+
+    @staticmethod
+    def _calc_entropy(probs: np.ndarray) -> np.ndarray:
+        # Entropy (in bits) of the distribution(s) laid out along the first axis; p*log2(p) is
+        # built in one scratch array, with log2 only evaluated where p is non-negligible
+        plogp = np.zeros_like(probs)
+        np.log2(probs, where=probs > 1e-9, out=plogp)
+        plogp *= probs
+        
+        return -plogp.sum(axis=0)
+
+    def _get_top_indices(self, n: int = 0) -> np.ndarray:
         if not n:
             n = self.TOP_N_CANDIDATES
         
-        sorted_probs = sorted(self.probabilities.items(), key=lambda x: x[1], reverse=True)
-        return sorted_probs[:n]
+        probs = self.probabilities
+        if n < len(probs):
+            # Quickselect the n-th best probability in O(N) instead of sorting everyone; candidates
+            # tied at the cut-off are taken in dataset order so the result matches a stable sort
+            kth_prob = -np.partition(-probs, n - 1)[n - 1]
+            above = np.flatnonzero(probs > kth_prob)
+            tied = np.flatnonzero(probs == kth_prob)[:n - len(above)]
+            top_idx = np.concatenate([above, tied])
+        else:
+            top_idx = np.arange(len(probs))
+        
+        # Order just those n: highest probability first, ties broken by dataset order
+        return top_idx[np.lexsort((top_idx, -probs[top_idx]))]
 
-    def _calc_info_gain_subset(self, subset_candidates: List[str], unasked_attrs: List[str]) -> Optional[str]:
-        if not subset_candidates or len(subset_candidates) < 1:
-            return None
+    def _get_top_candidates(self, n: int = 0) -> List[Tuple[str, float]]:
+        if not len(self.probabilities):
+            return []
         
-        subset_probs = {name: self.probabilities[name] for name in subset_candidates if name in self.probabilities and self.probabilities[name] > 1e-9}
-        subset_sum = sum(subset_probs.values())
-        if subset_sum < 1e-9:
-            return None
+        top_idx = self._get_top_indices(n)
+        return list(zip([self.dataset.people[i] for i in top_idx], self.probabilities[top_idx].tolist()))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _score_questions(dataset: Dataset, log_probs_key: bytes, top_n_key: bytes) -> np.ndarray:
+        # Info gain of every attribute under the general (row 0) and focused (row 1) strategy.
+        # It depends only on the posterior, so sessions that reach the same one (typically
+        # the first few questions) share the result; random sampling happens afterwards.
+        log_probs = np.frombuffer(log_probs_key)
+        top_n_idx = np.frombuffer(top_n_key, dtype=np.intp)
+        
+        # Both strategies are scored in one pass over the attribute matrix: row 0 is the full posterior
+        # (eliminated candidates carry zero mass), row 1 the posterior renormalized over the
+        # top candidates, which is a softmax over their slice of the log-posterior
+        strategy_probs = np.zeros((2, len(log_probs)))
+        strategy_probs[0] = Akinator._softmax(log_probs)
+        if len(top_n_idx):
+            strategy_probs[1, top_n_idx] = Akinator._softmax(log_probs[top_n_idx])
+        
+        weight_yes = strategy_probs @ dataset.attr_matrix
+        weight_no = 1.0 - weight_yes
+        
+        # For a deterministic yes/no attribute, H(subset) - H(subset | answer) collapses to the
+        # entropy of the split itself: the per-person terms of both sides cancel out.
+        info_gain = Akinator._calc_entropy(np.stack([weight_yes, weight_no]))
+        info_gain.flags.writeable = False    # Shared between sessions through the cache
+        
+        return info_gain
+
+    def _calc_info_gain_split(self, info_gain: np.ndarray, unasked_cols: np.ndarray) -> Optional[int]:
+        info_gain = info_gain[unasked_cols]
         
-        norm_probs = [p / subset_sum for p in subset_probs.values()]
-        subset_entropy = self._calc_entropy(norm_probs)
-        
-        best_attr = None
-        max_gain = -1.0
-        
-        for attr in unasked_attrs:
-            if attr in self.asked_attrs:    # Double check if attr is already asked
-                continue
-            
-            people_with_yes_prob = []
-            people_with_no_prob = []
-            sum_yes = 0.0
-            sum_no = 0.0
-            
-            for person in subset_candidates:
-                value = self.people_attrs_map[person].get(attr, 0)
-                prob = subset_probs.get(person, 0)
-                
-                if value == 1:
-                    people_with_yes_prob.append(prob)
-                    sum_yes += prob
-                elif value == 0:
-                    people_with_no_prob.append(prob)
-                    sum_no += prob
-            
-            weight_yes = sum_yes / subset_sum if subset_sum > 1e-9 else 0
-            weight_no = sum_no / subset_sum if subset_sum > 1e-9 else 0
-            
-            entropy_yes = self._calc_entropy(people_with_yes_prob)
-            entropy_no = self._calc_entropy(people_with_no_prob)
-            
-            conditional_entropy = weight_yes * entropy_yes + weight_no * entropy_no
-            info_gain = subset_entropy - conditional_entropy
-            
-            if info_gain > max_gain:
-                max_gain = info_gain
-                best_attr = attr
-        
-        if max_gain > 1e-9 and best_attr is not None:
-            return best_attr
+        best = int(np.argmax(info_gain))
+        if info_gain[best] > 1e-9:
+            return int(unasked_cols[best])
         
         return None
 
-    def _calc_info_gain_focused(self, top_n_names: List[str], unasked_attrs: List[str]) -> Optional[str]:
-        return self._calc_info_gain_subset(top_n_names, unasked_attrs)
-
-    def _calc_info_gain_general(self, unasked_attrs: List[str]) -> Optional[str]:
-        active_names = [name for name, prob in self.probabilities.items() if prob > 1e-9]
-        return self._calc_info_gain_subset(active_names, unasked_attrs)
-
     def _get_current_guess(self) -> Tuple[Optional[str], float]:
-        if not self.probabilities:
-            return None, 0.0
-        
-        sorted_probs = sorted(self.probabilities.items(), key=lambda x: x[1], reverse=True)
-        if not sorted_probs:
+        if not len(self.probabilities):
             return None, 0.0
         
-        best_guess, best_prob = sorted_probs[0]
+        best_idx = int(np.argmax(self.probabilities))
         
-        return best_guess, best_prob
+        return self.dataset.people[best_idx], float(self.probabilities[best_idx])
 
     def _update_probs(self, attr: str, answer: float) -> bool:
-        for person in list(self.probabilities.keys()):
-            value = self.people_attrs_map[person].get(attr, 0)
-            
-            # Valid for when answer is [0, 1] because attribute is also going to be [0, 1]
-            # (Strong match/mismatch for exact answers)
-            if value == answer:
-                self.probabilities[person] *= self.STRONG_MATCH_MULTIPLIER
-            elif abs(value - answer) == 1:
-                self.probabilities[person] *= self.STRONG_MISMATCH_MULTIPLIER
-            
-            # Valid for when answer is [0.25, 0.75] because attribute is going to be [0, 1] so
-            # difference is answer and value is going to be either 0.25 (match) or 0.75 (mismatch)
-            # (Soft match/mismatch for "probably" answers)
-            elif abs(value - answer) < 0.5:
-                self.probabilities[person] *= self.SOFT_MATCH_MULTIPLIER
-            elif abs(value - answer) > 0.5:
-                self.probabilities[person] *= self.SOFT_MISMATCH_MULTIPLIER
-        
-        current_sum = sum(self.probabilities.values())
-        if current_sum < 1e-9:  return False
-        
-        # Normalize probabilities
-        for name in self.probabilities:
-            if self.probabilities.get(name, 0) > 1e-9:
-                self.probabilities[name] /= current_sum
-            else:
-                self.probabilities[name] = 0.0
+        # Attributes are 0/1, so for answers in [0, 1] every person either matches the answer's side or doesn't:
+        # exact answers (0, 1) get the strong multipliers and "probably" answers (0.25, 0.75) the soft ones
+        if answer in (0, 1):
+            log_match, log_mismatch = self.LOG_STRONG_MULTIPLIERS
+        elif answer != 0.5:
+            log_match, log_mismatch = self.LOG_SOFT_MULTIPLIERS
+        else:
+            log_match, log_mismatch = 0.0, 0.0
         
-        return True
+        matches = self._attr_values(attr) == round(answer)
+        self.log_probs += np.where(matches, log_match, log_mismatch)
+        
+        return self._rebase_log_probs()
 
     def select_next_question(self) -> Optional[str]:
         if self.RETRY:
@@ -197,47 +262,44 @@ class Akinator:
         elif self.n_questions_asked > self.MIN_QUESTIONS and not self.RETRY:
             self.RANDOMNESS = 0.1
         
-        unasked_attrs = [attr for attr in self.attrs if attr not in self.asked_attrs]
-        if not unasked_attrs:
+        unasked_cols = np.flatnonzero(~self.asked_mask)
+        if not len(unasked_cols):
             return None
         
-        if self.RANDOMNESS > 0 and len(unasked_attrs) > 1:
-            sample_size = max(1, int((1 - self.RANDOMNESS) * len(unasked_attrs)))
-            sample_size = min(sample_size, len(unasked_attrs))
-            if sample_size < len(unasked_attrs):
-                unasked_attrs = random.sample(unasked_attrs, sample_size)
+        if self.RANDOMNESS > 0 and len(unasked_cols) > 1:
+            sample_size = max(1, int((1 - self.RANDOMNESS) * len(unasked_cols)))
+            sample_size = min(sample_size, len(unasked_cols))
+            if sample_size < len(unasked_cols):
+                unasked_cols = np.array(random.sample(unasked_cols.tolist(), sample_size), dtype=np.intp)
         
-        active_names = [name for name, prob in self.probabilities.items() if prob > 1e-9]
-        if not active_names:
+        if not self.alive_mask.any():
             return None
         
-        next_attr = None
+        top_n_idx = np.empty(0, dtype=np.intp)
         if self.n_questions_asked >= self.MIN_QUESTIONS:
-            top_n_names = [name for name, prob in self._get_top_candidates() if prob > 1e-9]
-
-            if len(top_n_names) > 1:
-                # Use focused information gain
-                next_attr = self._calc_info_gain_focused(top_n_names, unasked_attrs)
+            top_n_idx = self._get_top_indices()
+            top_n_idx = top_n_idx[self.alive_mask[top_n_idx]]
+            if len(top_n_idx) < 2:
+                top_n_idx = np.empty(0, dtype=np.intp)
+        
+        info_gain = self._score_questions(self.dataset, self.log_probs.tobytes(), top_n_idx.tobytes())
+        
+        next_col = None
+        if len(top_n_idx):
+            # Use focused information gain
+            next_col = self._calc_info_gain_split(info_gain[1], unasked_cols)
 
         # If no attribute is found from focused information gain, use general information gain
-        if not next_attr:
-            next_attr = self._calc_info_gain_general(unasked_attrs)
+        if next_col is None:
+            next_col = self._calc_info_gain_split(info_gain[0], unasked_cols)
         
-        if not next_attr and unasked_attrs:
-            next_attr = unasked_attrs[0]
+        if next_col is None:
+            next_col = unasked_cols[0]
         
-        return next_attr
+        return self.dataset.attrs[next_col]
 
     def get_question_text(self, attribute_key: str) -> str:
-        q_text = self.questions.get(attribute_key, f"Is the person {attribute_key.replace('_', ' ')}?")
-        
-        # Special logic for handling nickname
-        if attribute_key.startswith("nickname_"):
-            nickname = attribute_key.replace("nickname_", "").replace("_", " ")
-            if nickname != "None":
-                q_text = "Is the person's nickname " + nickname + "?"
-        
-        return f"Q{self.n_questions_asked + 1}: {q_text}"
+        return f"Q{self.n_questions_asked + 1}: {self.dataset.question_texts[attribute_key]}"
         
     # --- Backend methods ---
     def start_game(self) -> Dict[str, Any]:
@@ -260,18 +322,24 @@ class Akinator:
             }
 
     def process_answer(self, attribute_key: str, answer_numeric: float) -> Dict[str, Any]:
-        if attribute_key in self.asked_attrs:
+        attr_col = self.dataset.attr_index.get(attribute_key)
+        if attr_col is None:
+            # Not a question this game can ask; don't let it use up a turn
+            return {"status": "error", "message": "Unknown attribute."}
+        if self.asked_mask[attr_col]:
             return {"status": "error", "message": "Attribute already asked."}
         
-        self.asked_attrs.add(attribute_key)
+        self.asked_mask[attr_col] = True
+        
         self.n_questions_asked += 1
+        self.n_moves += 1
         self.RETRY = False
         
         if not self._update_probs(attribute_key, answer_numeric):
             return {"status": "failure", "message": "You beat me! I couldn't guess.", "guess": None, "certainty": 0.0}
         
         current_guess_name, current_certainty = self._get_current_guess()
-        remaining_candidates_count = sum(1 for p in self.probabilities.values() if p > 1e-9)
+        remaining_candidates_count = int(np.count_nonzero(self.alive_mask))
         
         if self.n_questions_asked >= self.MIN_QUESTIONS:
             if current_certainty >= self.CERTAINTY_THRESHOLD or (remaining_candidates_count == 1 and current_certainty > 0.1):
@@ -281,7 +349,7 @@ class Akinator:
                     "certainty": current_certainty,
                 }
         
-        if self.n_questions_asked >= len(self.attrs) or self.n_questions_asked >= self.MAX_QUESTIONS:
+        if self.n_questions_asked >= len(self.dataset.attrs) or self.n_questions_asked >= self.MAX_QUESTIONS:
             return {
                 "status": "failure",
                 "message": "You beat me! I couldn't guess.",
@@ -307,18 +375,13 @@ class Akinator:
             }
 
     def process_mistaken_guess(self, wrong_guess_name: str) -> Dict[str, Any]:
-        if wrong_guess_name in self.probabilities:
-            self.probabilities[wrong_guess_name] *= 0.01
-            current_sum = sum(p for p in self.probabilities.values() if p > 1e-9)
-        
-            if current_sum > 1e-9:
-                for name in self.probabilities:
-                    if self.probabilities[name] > 1e-9:
-                        self.probabilities[name] /= current_sum
-                    else:
-                        self.probabilities[name] = 0.0
+        guess_idx = self.dataset.person_index.get(wrong_guess_name)
+        if guess_idx is not None or not self.RETRY:
+            self.n_moves += 1
+        if guess_idx is not None:
+            self.log_probs[guess_idx] += self.LOG_WRONG_GUESS_MULTIPLIER
         
-            else:
+            if not self._rebase_log_probs():
                 return {"status": "failure", "message": "You beat me! I couldn't guess.", "guess": None, "certainty": 0.0}
         
         self.RETRY = True
@@ -343,20 +406,39 @@ class Akinator:
 
     # --- State Management for Database Persistence ---
     def get_state(self) -> Dict[str, Any]:
-        """Serializes the current dynamic game state to a JSON-compatible dictionary."""
+        """Serializes the current dynamic game state to a msgpack-compatible dictionary."""
         return {
-            "probabilities": self.probabilities,
-            "asked_attrs": list(self.asked_attrs), # Convert set to list for JSON
+            # Log-posterior as raw float32 bytes in dataset.people order; names are dataset-global so never stored
+            "log_probs": self.log_probs.astype(np.float32).tobytes(),
+            "asked_mask": np.packbits(self.asked_mask).tobytes(), # One bit per dataset.attrs column
             "n_questions_asked": self.n_questions_asked,
+            "dataset": self.dataset.fingerprint,
+            "n_moves": self.n_moves,
             "RANDOMNESS": self.RANDOMNESS,
             "RETRY": self.RETRY,
         }
 
+    @classmethod
+    def from_state(cls, dataset: Dataset, state: Dict[str, Any]) -> "Akinator":
+        """Rebuilds a game from get_state() output, skipping the fresh-game setup that _load_state would overwrite."""
+        game = cls.__new__(cls)
+        game.dataset = dataset
+        game._load_state(state)
+        return game
+
     def _load_state(self, state: Dict[str, Any]):
         """Restores the dynamic game state from a dictionary."""
-        self.probabilities = state.get("probabilities", {})
-        self.asked_attrs = set(state.get("asked_attrs", [])) # Convert list back to set
+        if state.get("dataset") != self.dataset.fingerprint:
+            raise ValueError("Saved game does not match the loaded dataset.")
+        # Saved right after a rebase, so eliminated candidates are already -inf; the posterior is
+        # only recomputed if something reads it before the next answer rebases again
+        self.log_probs = np.frombuffer(state["log_probs"], dtype=np.float32).astype(np.float64)
+        self._probabilities = None
+        self.alive_mask = np.isfinite(self.log_probs)
+        asked_bits = np.frombuffer(state["asked_mask"], dtype=np.uint8)
+        self.asked_mask = np.unpackbits(asked_bits, count=len(self.dataset.attrs)).astype(bool)
         self.n_questions_asked = state.get("n_questions_asked", 0)
+        self.n_moves = state.get("n_moves", self.n_questions_asked)
         self.RANDOMNESS = state.get("RANDOMNESS", 0.5) # Default if not in state
         self.RETRY = state.get("RETRY", False) # Default if not in state
         print(f"Game state loaded. Questions asked: {self.n_questions_asked}, Retry: {self.RETRY}")
@@ -369,15 +451,14 @@ class Akinator:
         self._reset()
         while True:
             current_best_guess_name, current_max_certainty = self._get_current_guess()
-            remaining_candidates_count = sum(1 for p in self.probabilities.values() if p > 1e-9)
+            remaining_candidates_count = int(np.count_nonzero(self.alive_mask))
             if remaining_candidates_count == 0 and self.n_questions_asked > 0:
                 print("\nHmm, based on your answers, I don't think the person is in my database or there's a contradiction.")
                 break
             made_a_guess_this_turn = False
             if self.n_questions_asked >= self.MIN_QUESTIONS:
                 if current_max_certainty >= self.CERTAINTY_THRESHOLD or (remaining_candidates_count == 1 and current_max_certainty > 0.1):
-                    certainty_to_display = current_max_certainty if remaining_candidates_count > 1 else self.probabilities.get(current_best_guess_name, 1.0)
-                    print(f"\nI am {certainty_to_display*100:.1f}% sure. Are you thinking of {current_best_guess_name}?")
+                    print(f"\nI am {current_max_certainty*100:.1f}% sure. Are you thinking of {current_best_guess_name}?")
                     final_ans = input("(yes/no): ").strip().lower()
                     made_a_guess_this_turn = True
                     if final_ans in ['yes', 'y']:
@@ -385,19 +466,13 @@ class Akinator:
                         return
                     else:
                         print(f"Oh, I was mistaken about {current_best_guess_name}. Let me try again.")
-                        if current_best_guess_name in self.probabilities:
-                            self.probabilities[current_best_guess_name] *= 0.01
-                            current_sum_probs = sum(p for p in self.probabilities.values() if p > 1e-9)
-                            if current_sum_probs > 1e-9:
-                                for name_key in self.probabilities:
-                                    if self.probabilities[name_key] > 1e-9:
-                                        self.probabilities[name_key] /= current_sum_probs
-                                    else:
-                                        self.probabilities[name_key] = 0.0
-                            else:
+                        guess_idx = self.dataset.person_index.get(current_best_guess_name)
+                        if guess_idx is not None:
+                            self.log_probs[guess_idx] += self.LOG_WRONG_GUESS_MULTIPLIER
+                            if not self._rebase_log_probs():
                                 print("It seems my knowledge is exhausted or answers are inconsistent.")
                                 return
-            if self.n_questions_asked >= len(self.attrs) and not made_a_guess_this_turn:
+            if self.n_questions_asked >= len(self.dataset.attrs) and not made_a_guess_this_turn:
                 if current_best_guess_name and current_max_certainty > 0.01:
                     print(f"\nI've asked all I can. My best guess is {current_best_guess_name} (Certainty: {current_max_certainty*100:.1f}%). Is it them?")
                     final_ans = input("(yes/no): ").strip().lower()
@@ -428,13 +503,12 @@ class Akinator:
                 user_response_str = input(f"{q_text} (yes/no/probably/probably not/y/n/p/pn): ").strip().lower()
             usr_ans_dict = {'yes': 1, 'y': 1, 'no': 0, 'n': 0, 'probably': 0.75, 'p': 0.75, 'probably not': 0.25, 'pn': 0.25}
             user_answer_numeric = usr_ans_dict[user_response_str]
-            self.asked_attrs.add(next_attribute_to_ask)
+            self.asked_mask[self.dataset.attr_index[next_attribute_to_ask]] = True
             if not self._update_probs(next_attribute_to_ask, user_answer_numeric):
                 print("\nHmm, based on your answers, it seems there's a contradiction or the person isn't in my database.")
                 break
-            sorted_probs = sorted(self.probabilities.items(), key=lambda item: item[1], reverse=True)
             print("\n--- Current Top 5 Candidates ---")
-            for name, prob in sorted_probs[:5]:
+            for name, prob in self._get_top_candidates(5):
                 if prob > 0.01:
                     print(f"{name}: {prob*100:.1f}%")
 
@@ -442,5 +516,5 @@ class Akinator:
 if __name__ == "__main__":
     dataset_path = "data/characters_data.json"  # Path to your dataset
     questions_path = "data/questions.json"  # Path to your questions
-    game = Akinator(dataset_path, questions_path)
+    game = Akinator(Dataset.load(dataset_path, questions_path))
     game.play()
\ No newline at end of file